@@ -1,14 +1,40 @@
-from fastapi import APIRouter, Depends, Query, status
-from sqlalchemy.orm import Session
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, sessionmaker
 
-from app.crud import create_request, get_all_requests, get_analytics_stats
-from app.database import get_db
-from app.schemas import AnalyticsStats, PaginatedResponse, RequestCreate, RequestResponse
+from app.crud import (
+    create_request,
+    get_all_requests,
+    get_analytics_stats,
+    update_requests,
+)
+from app.database import get_db, get_session_factory
+from app.events import broadcaster
+from app.schemas import (
+    AnalyticsStats,
+    BatchUpdate,
+    BatchUpdateItem,
+    BatchUpdateResult,
+    PaginatedResponse,
+    RequestCreate,
+    RequestResponse,
+    RequestUpdate,
+)
 
 router = APIRouter(tags=["Maintenance Requests"])
 
 analytics_router = APIRouter(tags=["Analytics"])
 
+events_router = APIRouter(tags=["Events"])
+
 
 @router.post(
     "",
@@ -32,10 +58,67 @@ def create_maintenance_request(
 def list_maintenance_requests(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(5, ge=1, le=100, description="Max records per page"),
+    include_archived: bool = Query(
+        False, description="Also list completed requests moved to the archive"
+    ),
     db: Session = Depends(get_db),
 ) -> PaginatedResponse:
     """Return a paginated list of maintenance requests, newest first."""
-    return get_all_requests(db, skip=skip, limit=limit)
+    return get_all_requests(
+        db, skip=skip, limit=limit, include_archived=include_archived
+    )
+
+
+@router.patch(
+    "/{request_id}",
+    response_model=RequestResponse,
+    summary="Update a request's status and/or priority",
+    responses={
+        status.HTTP_404_NOT_FOUND: {"description": "Request not found"},
+        status.HTTP_409_CONFLICT: {"description": "Version is stale"},
+    },
+)
+def update_maintenance_request(
+    request_id: int,
+    payload: RequestUpdate,
+    db: Session = Depends(get_db),
+) -> RequestResponse:
+    """Change lifecycle fields of one request with an optional version check."""
+    result = update_requests(
+        db,
+        [BatchUpdateItem(id=request_id, version=payload.version)],
+        payload.changes(),
+    )
+    if result["not_found"]:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Maintenance request {request_id} not found.",
+        )
+    if result["conflicts"]:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=(
+                f"Maintenance request {request_id} was modified; "
+                "reload it and retry."
+            ),
+        )
+    return result["updated"][0]
+
+
+@router.post(
+    "/batch-update",
+    response_model=BatchUpdateResult,
+    summary="Update status and/or priority of many requests at once",
+)
+def batch_update_maintenance_requests(
+    payload: BatchUpdate,
+    db: Session = Depends(get_db),
+) -> BatchUpdateResult:
+    """Apply one status/priority change to every listed request.
+
+    Stale or unknown ids are reported back instead of failing the batch.
+    """
+    return update_requests(db, payload.items, payload.changes())
 
 
 @analytics_router.get(
@@ -48,3 +131,28 @@ def get_stats(
 ) -> AnalyticsStats:
     """Return aggregated statistics for the dashboard cards."""
     return get_analytics_stats(db)
+
+
+@events_router.get(
+    "",
+    response_class=StreamingResponse,
+    summary="Stream request changes and stats deltas (Server-Sent Events)",
+)
+async def stream_events(
+    request: Request,
+    last_event_id: str | None = Header(
+        None, description="Resume after this event id (sent by EventSource)"
+    ),
+    session_factory: sessionmaker = Depends(get_session_factory),
+) -> StreamingResponse:
+    """Push each created or updated request and its analytics delta."""
+    resume_from = None
+    if last_event_id and last_event_id.isdigit():
+        resume_from = int(last_event_id)
+    return StreamingResponse(
+        broadcaster.stream(
+            session_factory, request.is_disconnected, resume_from
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,50 @@
+"""Command-line entry point for archiving completed requests.
+
+Run periodically (e.g. from a cron job) to keep the live table small::
+
+    python -m app.archive --days 90 --batch-size 500
+"""
+
+import argparse
+import logging
+from datetime import timedelta
+
+from app.core.config import settings
+from app.crud import archive_completed_requests
+from app.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Archive requests completed over ``--days`` ago and return the count."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=settings.archive_after_days,
+        help="Archive requests completed more than this many days ago",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=settings.archive_batch_size,
+        help="Rows moved per transaction",
+    )
+    args = parser.parse_args(argv)
+
+    db = SessionLocal()
+    try:
+        archived = archive_completed_requests(
+            db, older_than=timedelta(days=args.days), batch_size=args.batch_size
+        )
+    finally:
+        db.close()
+
+    logger.info("Archiving finished: %d requests moved.", archived)
+    return archived
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
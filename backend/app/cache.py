@@ -0,0 +1,141 @@
+"""In-process hot-set cache for the newest maintenance requests.
+
+Almost all list traffic asks for the first page, so each instance keeps a
+bounded ring buffer of the newest serialized requests plus the current
+total.  Freshness is decided by comparing against the single-row
+``DatasetVersion`` counter, which every write bumps.
+
+Memory is bounded twice: by row count (``HOT_CACHE_SIZE``) and by the
+approximate size of the cached rows (``HOT_CACHE_MAX_BYTES``).  Rows have
+no length limit on ``description``, so the byte budget is what actually
+caps the footprint; the oldest rows are evicted first to stay under it.
+"""
+
+import logging
+import sys
+import threading
+from collections import deque
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _entry_bytes(item: dict) -> int:
+    """Approximate in-memory size of one serialized request."""
+    return sys.getsizeof(item) + sum(sys.getsizeof(v) for v in item.values())
+
+
+class HotSetCache:
+    """Bounded, newest-first buffer of serialized requests.
+
+    The buffer is only trusted while its version matches the database
+    counter; any mismatch makes ``get`` miss so the caller re-warms it.
+    It always holds a newest-first prefix of the table, so evicting old
+    rows only means deeper pages are read from the database.
+    """
+
+    def __init__(self, capacity: int, max_bytes: int | None = None) -> None:
+        self.capacity = max(0, capacity)
+        self.max_bytes = max_bytes
+        self._items: deque[dict] = deque()
+        self._bytes = 0
+        self._total = 0
+        self._version: int | None = None
+        self._lock = threading.Lock()
+
+    def get(self, version: int) -> tuple[list[dict], int] | None:
+        """Return ``(newest_items, total)`` if the buffer is at ``version``."""
+        with self._lock:
+            if self._version is None or self._version != version:
+                return None
+            return list(self._items), self._total
+
+    def load(self, version: int, items: list[dict], total: int) -> None:
+        """Replace the buffer with freshly queried rows (newest first)."""
+        with self._lock:
+            self._items.clear()
+            self._items.extend(items[: self.capacity])
+            self._bytes = sum(_entry_bytes(item) for item in self._items)
+            self._trim()
+            self._total = total
+            self._version = version
+        logger.info(
+            "Hot-set cache warmed at version %d: %d/%d rows, ~%d bytes.",
+            version,
+            len(self._items),
+            self.capacity,
+            self.footprint()["bytes"],
+        )
+
+    def push(self, version: int, item: dict) -> None:
+        """Write-through a newly created request committed at ``version``.
+
+        Applied only when the buffer was exactly one write behind; anything
+        else means another writer got in first, so the buffer is dropped.
+        """
+        with self._lock:
+            if self._version == version:
+                return
+            if self._version != version - 1:
+                self._invalidate()
+                return
+            if all(cached["id"] != item["id"] for cached in self._items):
+                self._items.appendleft(item)
+                self._bytes += _entry_bytes(item)
+                self._total += 1
+                self._trim()
+            self._version = version
+
+    def replace(self, version: int, items: list[dict]) -> None:
+        """Write-through updated requests committed at ``version``.
+
+        Entries are swapped in place by id; rows outside the buffer are
+        ignored since an update never changes the newest-first order.
+        """
+        with self._lock:
+            if self._version == version:
+                return
+            if self._version != version - 1:
+                self._invalidate()
+                return
+            by_id = {item["id"]: item for item in items}
+            for index, cached in enumerate(self._items):
+                if cached["id"] in by_id:
+                    item = by_id[cached["id"]]
+                    self._bytes += _entry_bytes(item) - _entry_bytes(cached)
+                    self._items[index] = item
+            self._trim()
+            self._version = version
+
+    def invalidate(self) -> None:
+        """Force the next read to re-warm from the database."""
+        with self._lock:
+            self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._items.clear()
+        self._bytes = 0
+        self._total = 0
+        self._version = None
+
+    def _trim(self) -> None:
+        # Drop the oldest rows until both the row and byte limits hold
+        while len(self._items) > self.capacity or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        ):
+            self._bytes -= _entry_bytes(self._items.pop())
+
+    def footprint(self) -> dict[str, int | None]:
+        """Report limits, occupancy and an approximate size in bytes."""
+        with self._lock:
+            return {
+                "capacity": self.capacity,
+                "max_bytes": self.max_bytes,
+                "size": len(self._items),
+                "bytes": sys.getsizeof(self._items) + self._bytes,
+            }
+
+
+# One buffer per process, shared by every request handled by this instance
+hot_set = HotSetCache(settings.hot_cache_size, settings.hot_cache_max_bytes)
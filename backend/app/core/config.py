@@ -22,5 +22,29 @@ class Settings(BaseSettings):
     frontend_url: str 
     database_url: str 
 
+    # Number of newest requests held in the in-process hot-set cache.
+    hot_cache_size: int = 50
+
+    # Upper bound on the approximate bytes held by the hot-set cache; the
+    # oldest cached requests are evicted to stay under it.
+    hot_cache_max_bytes: int = 1_048_576
+
+    # Requests completed more than this many days ago are moved to the archive.
+    archive_after_days: int = 90
+    archive_batch_size: int = 500
+
+    # Live event feed (GET /api/events).  LISTEN/NOTIFY needs a direct
+    # Postgres connection; set this when DATABASE_URL is a Neon "-pooler"
+    # (PgBouncer transaction-mode) endpoint.
+    database_direct_url: str | None = None
+    event_history_size: int = 1000
+    event_heartbeat_seconds: float = 15.0
+    event_poll_seconds: float = 2.0
+    # With LISTEN/NOTIFY the table is only re-read on a notify or after
+    # this long, so idle instances let Neon autosuspend
+    event_safety_poll_seconds: float = 300.0
+    # Batch updates touching more rows than this send a refetch hint
+    event_max_changes: int = 500
+
 
 settings = Settings()
\ No newline at end of file
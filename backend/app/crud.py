@@ -1,9 +1,92 @@
-from sqlalchemy import func, select
+import logging
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, insert, or_, select, tuple_, union_all, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
+from app.cache import hot_set
 from app.core.ai_logic import generate_summary, suggest_category
-from app.models import MaintenanceRequest, Priority
-from app.schemas import RequestCreate
+from app.core.config import settings
+from app.events import EVENTS_CHANNEL, broadcaster
+from app.models import (
+    ArchivedAggregate,
+    ArchivedMaintenanceRequest,
+    DatasetVersion,
+    MaintenanceRequest,
+    Priority,
+    RequestEvent,
+    Status,
+)
+from app.schemas import BatchUpdateItem, RequestCreate, RequestResponse
+
+logger = logging.getLogger(__name__)
+
+
+def get_dataset_version(db: Session) -> int:
+    """Return the current write counter for ``maintenance_requests``."""
+    stmt = select(DatasetVersion.version).where(DatasetVersion.id == 1)
+    return db.scalar(stmt) or 0
+
+
+def _bump_dataset_version(db: Session) -> int:
+    """Increment the write counter inside the caller's transaction.
+
+    The counter row is seeded when its table is created, so this is a
+    single atomic ``UPDATE ... RETURNING``.
+    """
+    return db.execute(
+        update(DatasetVersion)
+        .where(DatasetVersion.id == 1)
+        .values(version=DatasetVersion.version + 1)
+        .returning(DatasetVersion.version)
+    ).scalar_one()
+
+
+def _serialize(row: MaintenanceRequest | dict) -> dict:
+    return RequestResponse.model_validate(row).model_dump()
+
+
+def _record_event(db: Session, event: str, data: dict) -> None:
+    """Queue a live-feed event inside the caller's transaction.
+
+    On Postgres a ``NOTIFY`` is issued too; it is only delivered on commit,
+    so listeners never see an event for a rolled-back change.
+    """
+    row = RequestEvent(event=event, data=data)
+    db.add(row)
+    db.flush()
+    db.execute(
+        delete(RequestEvent).where(
+            RequestEvent.id <= row.id - settings.event_history_size
+        )
+    )
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(select(func.pg_notify(EVENTS_CHANNEL, str(row.id))))
+
+
+def _stats_delta(category: str | None, priority: Priority, sign: int = 1) -> dict:
+    """Describe how one request changes the dashboard analytics."""
+    return {
+        "total_requests": sign,
+        "high_priority_count": sign if priority == Priority.HIGH else 0,
+        "categories": {category: sign} if category is not None else {},
+    }
+
+
+def _warm_hot_set(db: Session, version: int) -> tuple[list[dict], int]:
+    """Load the newest rows and the total into the in-process cache."""
+    total = db.scalar(select(func.count(MaintenanceRequest.id))) or 0
+    stmt = (
+        select(MaintenanceRequest)
+        .order_by(MaintenanceRequest.created_at.desc())
+        .limit(hot_set.capacity)
+    )
+    items = [_serialize(row) for row in db.scalars(stmt).all()]
+    hot_set.load(version, items, total)
+    return items, total
 
 
 def create_request(db: Session, payload: RequestCreate) -> MaintenanceRequest:
@@ -22,27 +105,199 @@ def create_request(db: Session, payload: RequestCreate) -> MaintenanceRequest:
         ai_summary=ai_summary,
         priority=payload.priority,
         status=payload.status,
+        completed_at=(
+            datetime.now(timezone.utc)
+            if payload.status == Status.COMPLETED
+            else None
+        ),
     )
     db.add(db_request)
+    version = _bump_dataset_version(db)
+    db.flush()
+    _record_event(
+        db,
+        "request.created",
+        {
+            "request": RequestResponse.model_validate(db_request).model_dump(
+                mode="json"
+            ),
+            "stats": _stats_delta(category, payload.priority),
+        },
+    )
     db.commit()
     db.refresh(db_request)
+    hot_set.push(version, _serialize(db_request))
+    broadcaster.wake()
     return db_request
 
 
+def update_requests(
+    db: Session, items: list[BatchUpdateItem], changes: dict
+) -> dict:
+    """Apply the same status/priority ``changes`` to many requests.
+
+    All targets are updated by one ``UPDATE ... RETURNING`` statement.
+    Items carrying a ``version`` only match while the row is still at
+    that version; every updated row gets its version bumped.  The cache
+    version and the live-feed event (with its high-priority delta) are
+    written in the same transaction.
+    """
+    targets = {item.id: item.version for item in items}
+    unversioned = [i for i, v in targets.items() if v is None]
+    versioned = [(i, v) for i, v in targets.items() if v is not None]
+
+    table = MaintenanceRequest.__table__
+    match = []
+    if unversioned:
+        match.append(table.c.id.in_(unversioned))
+    if versioned:
+        match.append(tuple_(table.c.id, table.c.version).in_(versioned))
+    where = or_(*match)
+
+    high_delta = 0
+    if "priority" in changes:
+        # Lock the targets and note their priority before it is overwritten
+        locked = db.execute(
+            select(table.c.id, table.c.priority).where(where).with_for_update()
+        ).all()
+        high_delta = -sum(priority == Priority.HIGH for _, priority in locked)
+        where = table.c.id.in_([row_id for row_id, _ in locked])
+
+    values = dict(changes, version=table.c.version + 1)
+    if "status" in changes:
+        # Keep the original completion time when a request is re-completed
+        values["completed_at"] = (
+            func.coalesce(table.c.completed_at, datetime.now(timezone.utc))
+            if changes["status"] == Status.COMPLETED
+            else None
+        )
+
+    stmt = (
+        update(table)
+        .where(where)
+        .values(**values)
+        .returning(*table.c)
+    )
+    rows = db.execute(stmt).mappings().all()
+
+    updated = [_serialize(dict(row)) for row in rows]
+    if "priority" in changes:
+        high_delta += sum(row["priority"] == Priority.HIGH for row in rows)
+
+    missing = set(targets) - {row["id"] for row in rows}
+    existing = set()
+    if missing:
+        existing = set(
+            db.scalars(
+                select(MaintenanceRequest.id).where(
+                    MaintenanceRequest.id.in_(missing)
+                )
+            ).all()
+        )
+
+    version = None
+    if updated:
+        version = _bump_dataset_version(db)
+        _record_event(
+            db,
+            "requests.updated",
+            {
+                "requests": _compact_changes(updated),
+                "stats": {
+                    "total_requests": 0,
+                    "high_priority_count": high_delta,
+                    "categories": {},
+                },
+            },
+        )
+    db.commit()
+
+    if version is not None:
+        hot_set.replace(version, updated)
+        broadcaster.wake()
+
+    return {
+        "updated": updated,
+        "conflicts": sorted(existing),
+        "not_found": sorted(missing - existing),
+    }
+
+
+def _compact_changes(updated: list[dict]) -> list[dict] | None:
+    """Return the changed fields per row, or ``None`` for large batches.
+
+    Above ``event_max_changes`` rows clients get a refetch hint instead,
+    so one batch never turns into a multi-megabyte event.
+    """
+    if len(updated) > settings.event_max_changes:
+        return None
+    return [
+        {
+            "id": item["id"],
+            "status": item["status"].value,
+            "priority": item["priority"].value,
+            "version": item["version"],
+        }
+        for item in updated
+    ]
+
+
 def get_all_requests(
-    db: Session, *, skip: int = 0, limit: int = 5
+    db: Session, *, skip: int = 0, limit: int = 5, include_archived: bool = False
 ) -> dict:
-    """Return a paginated list of maintenance requests, newest first."""
-    total = db.scalar(select(func.count(MaintenanceRequest.id))) or 0
+    """Return a paginated list of maintenance requests, newest first.
+
+    Pages inside the hot set (or any page when the hot set holds every
+    row) are served from memory; deeper pages still hit the database but
+    reuse the cached total.  ``include_archived`` reads live and archived
+    rows together and bypasses the cache.
+    """
+    if include_archived:
+        return _get_requests_with_archive(db, skip=skip, limit=limit)
+
+    version = get_dataset_version(db)
+    cached = hot_set.get(version)
+    if cached is None:
+        cached = _warm_hot_set(db, version)
+    head, total = cached
+
+    if skip + limit <= len(head) or len(head) == total:
+        items = head[skip : skip + limit]
+    else:
+        stmt = (
+            select(MaintenanceRequest)
+            .order_by(MaintenanceRequest.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        items = list(db.scalars(stmt).all())
 
+    return _paginate(items, total, skip=skip, limit=limit)
+
+
+def _get_requests_with_archive(db: Session, *, skip: int, limit: int) -> dict:
+    """Page through live and archived requests as one newest-first list."""
+    total = (
+        db.scalar(select(func.count(MaintenanceRequest.id))) or 0
+    ) + _archived_total(db)
+
+    columns = [c.key for c in MaintenanceRequest.__table__.columns]
+    combined = union_all(
+        select(*(getattr(MaintenanceRequest, c) for c in columns)),
+        select(*(getattr(ArchivedMaintenanceRequest, c) for c in columns)),
+    ).subquery()
     stmt = (
-        select(MaintenanceRequest)
-        .order_by(MaintenanceRequest.created_at.desc())
+        select(combined)
+        .order_by(combined.c.created_at.desc())
         .offset(skip)
         .limit(limit)
     )
-    items = list(db.scalars(stmt).all())
+    items = [dict(row) for row in db.execute(stmt).mappings()]
+
+    return _paginate(items, total, skip=skip, limit=limit)
+
 
+def _paginate(items: list, total: int, *, skip: int, limit: int) -> dict:
     page = (skip // limit) + 1 if limit > 0 else 1
     pages = max(1, -(-total // limit)) if limit > 0 else 1 
 
@@ -54,8 +309,16 @@ def get_all_requests(
     }
 
 
+def _archived_total(db: Session) -> int:
+    return db.scalar(select(func.sum(ArchivedAggregate.count))) or 0
+
+
 def get_analytics_stats(db: Session) -> dict:
-    """Return aggregated analytics for the dashboard."""
+    """Return aggregated analytics for the dashboard.
+
+    Live-table aggregates are combined with the archived per-category and
+    per-priority counts, so archiving never changes the totals.
+    """
     total = db.scalar(select(func.count(MaintenanceRequest.id))) or 0
 
     high_priority = (
@@ -67,24 +330,138 @@ def get_analytics_stats(db: Session) -> dict:
         or 0
     )
 
+    category_counts: Counter[str] = Counter(
+        dict(
+            db.execute(
+                select(
+                    MaintenanceRequest.category,
+                    func.count(MaintenanceRequest.id),
+                )
+                .where(MaintenanceRequest.category.is_not(None))
+                .group_by(MaintenanceRequest.category)
+            ).all()
+        )
+    )
+
+    archived = db.execute(
+        select(
+            ArchivedAggregate.category,
+            ArchivedAggregate.priority,
+            ArchivedAggregate.count,
+        )
+    ).all()
+    for category, priority, count in archived:
+        total += count
+        if priority == Priority.HIGH:
+            high_priority += count
+        if category != ArchivedAggregate.UNCATEGORIZED:
+            category_counts[category] += count
+
     # Most common non-null category
     most_common_category = None
-    if total > 0:
-        row = db.execute(
-            select(
-                MaintenanceRequest.category,
-                func.count(MaintenanceRequest.id).label("cnt"),
-            )
-            .where(MaintenanceRequest.category.is_not(None))
-            .group_by(MaintenanceRequest.category)
-            .order_by(func.count(MaintenanceRequest.id).desc())
-            .limit(1)
-        ).first()
-        if row:
-            most_common_category = row[0]
+    if category_counts:
+        most_common_category = category_counts.most_common(1)[0][0]
 
     return {
         "total_requests": total,
         "most_common_category": most_common_category,
         "high_priority_count": high_priority,
     }
+
+
+def archive_completed_requests(
+    db: Session, *, older_than: timedelta, batch_size: int = 500
+) -> int:
+    """Move requests completed more than ``older_than`` ago to the archive.
+
+    Each batch is copied, counted into ``ArchivedAggregate`` and deleted
+    from the live table in its own transaction, so an interrupted run
+    leaves consistent data and simply resumes on the next call.  Returns
+    the number of archived rows.
+    """
+    cutoff = datetime.now(timezone.utc) - older_than
+    columns = [c.key for c in MaintenanceRequest.__table__.columns]
+    archived = 0
+
+    while True:
+        ids = list(
+            db.scalars(
+                select(MaintenanceRequest.id)
+                .where(
+                    MaintenanceRequest.status == Status.COMPLETED,
+                    MaintenanceRequest.completed_at < cutoff,
+                )
+                .order_by(MaintenanceRequest.id)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            ).all()
+        )
+        if not ids:
+            break
+
+        db.execute(
+            insert(ArchivedMaintenanceRequest).from_select(
+                columns,
+                select(
+                    *(getattr(MaintenanceRequest, c) for c in columns)
+                ).where(MaintenanceRequest.id.in_(ids)),
+            )
+        )
+
+        batch_counts = db.execute(
+            select(
+                MaintenanceRequest.category,
+                MaintenanceRequest.priority,
+                func.count(MaintenanceRequest.id),
+            )
+            .where(MaintenanceRequest.id.in_(ids))
+            .group_by(MaintenanceRequest.category, MaintenanceRequest.priority)
+        ).all()
+        _add_archived_counts(db, batch_counts)
+
+        db.execute(
+            delete(MaintenanceRequest).where(MaintenanceRequest.id.in_(ids))
+        )
+        _bump_dataset_version(db)
+        db.commit()
+
+        archived += len(ids)
+        logger.info(
+            "Archived %d completed requests (%d so far).", len(ids), archived
+        )
+
+    return archived
+
+
+def _add_archived_counts(
+    db: Session, counts: list[tuple[str | None, Priority, int]]
+) -> None:
+    """Add per-(category, priority) counts with one atomic upsert.
+
+    ``INSERT ... ON CONFLICT DO UPDATE`` keeps concurrent archiver runs
+    from racing each other on a missing row.
+    """
+    merged: Counter[tuple[str, Priority]] = Counter()
+    for category, priority, count in counts:
+        key = category if category is not None else ArchivedAggregate.UNCATEGORIZED
+        merged[(key, priority)] += count
+    if not merged:
+        return
+
+    dialect_insert = (
+        postgresql_insert
+        if db.get_bind().dialect.name == "postgresql"
+        else sqlite_insert
+    )
+    stmt = dialect_insert(ArchivedAggregate).values(
+        [
+            {"category": category, "priority": priority, "count": count}
+            for (category, priority), count in merged.items()
+        ]
+    )
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["category", "priority"],
+            set_={"count": ArchivedAggregate.count + stmt.excluded["count"]},
+        )
+    )
@@ -6,7 +6,7 @@ Connects to Neon PostgreSQL via psycopg2 with SSL required.
 import logging
 from collections.abc import Generator
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import Engine, create_engine, inspect, text
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from app.core.config import settings
@@ -34,6 +34,45 @@ class Base(DeclarativeBase):
     """Base class for all SQLAlchemy ORM models."""
 
 
+# Columns added after their table first shipped.  ``create_all`` never
+# alters existing tables, so ``upgrade_schema`` adds them on startup.
+_ADDED_COLUMNS: dict[str, dict[str, str]] = {
+    "maintenance_requests": {
+        "version": "INTEGER NOT NULL DEFAULT 1",
+        "completed_at": "TIMESTAMP WITH TIME ZONE",
+    },
+    "maintenance_requests_archive": {
+        "version": "INTEGER NOT NULL DEFAULT 1",
+        "completed_at": "TIMESTAMP WITH TIME ZONE",
+    },
+}
+
+# Statements run once, right after a column above is added.  Requests
+# completed before ``completed_at`` existed fall back to their creation time.
+_BACKFILLS: dict[str, str] = {
+    "completed_at": (
+        "UPDATE {table} SET completed_at = created_at WHERE status = 'COMPLETED'"
+    ),
+}
+
+
+def upgrade_schema(bind: Engine) -> None:
+    """Add any missing ``_ADDED_COLUMNS`` to existing tables (idempotent)."""
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+    with bind.begin() as conn:
+        for table, columns in _ADDED_COLUMNS.items():
+            if table not in existing_tables:
+                continue
+            present = {c["name"] for c in inspector.get_columns(table)}
+            for name, ddl in columns.items():
+                if name not in present:
+                    logger.info("Adding column %s.%s", table, name)
+                    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}"))
+                    if name in _BACKFILLS:
+                        conn.execute(text(_BACKFILLS[name].format(table=table)))
+
+
 def get_db() -> Generator[Session, None, None]:
     """FastAPI dependency that provides a transactional database session.
 
@@ -44,3 +83,12 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+def get_session_factory() -> sessionmaker:
+    """FastAPI dependency that provides the session factory itself.
+
+    Used by long-lived background work (the event listener) that must not
+    hold a request-scoped session open.
+    """
+    return SessionLocal
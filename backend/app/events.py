@@ -0,0 +1,295 @@
+"""Live event feed: in-process broadcaster with cross-instance fan-out.
+
+Every write records a ``RequestEvent`` row in the same transaction as the
+change it describes.  One background thread per instance picks up new
+rows — woken by Postgres ``LISTEN/NOTIFY`` or, on other databases, by
+polling — and hands them to each SSE client connected to this instance.
+The thread only runs while at least one client is connected.
+
+On Vercel the API is a serverless function: a stream (and the listener
+thread with it) is cut off at the function's maximum duration.  Browsers'
+``EventSource`` reconnects after ``RETRY_MS`` with ``Last-Event-ID``, so
+clients still receive every event, just over a series of connections.
+A client that was away longer than the stored history gets a ``reset``
+event and refetches instead.
+"""
+
+import asyncio
+import json
+import logging
+import select as io_select
+import threading
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.models import RequestEvent
+
+logger = logging.getLogger(__name__)
+
+EVENTS_CHANNEL = "request_events"
+
+# Client reconnect delay advertised in the stream, in milliseconds
+RETRY_MS = 3000
+
+# Events buffered per client before new ones are dropped for it
+QUEUE_SIZE = 100
+
+# Ids below the newest one seen that are re-checked on each fetch, so a
+# transaction that committed out of id order is still delivered
+RESCAN_WINDOW = 100
+
+# Sent on resume when the missed events are no longer stored
+RESET_EVENT = "reset"
+
+
+def format_sse(event: dict) -> str:
+    """Render an event dict as one Server-Sent Events message."""
+    return (
+        f"id: {event['id']}\n"
+        f"event: {event['event']}\n"
+        f"data: {json.dumps(event['data'])}\n\n"
+    )
+
+
+def _to_dict(row: RequestEvent) -> dict:
+    return {"id": row.id, "event": row.event, "data": row.data}
+
+
+class EventBroadcaster:
+    """Fan new ``RequestEvent`` rows out to this instance's SSE clients."""
+
+    def __init__(self, *, heartbeat_seconds: float, poll_seconds: float) -> None:
+        self.heartbeat_seconds = heartbeat_seconds
+        self.poll_seconds = poll_seconds
+        self._subscribers: dict[asyncio.Queue, asyncio.AbstractEventLoop] = {}
+        self._lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._session_factory: sessionmaker | None = None
+        self._seen: set[int] = set()
+        self._max_seen = 0
+
+    # ── Listener lifecycle ─────────────────────────────────────────
+
+    def ensure_started(self, session_factory: sessionmaker) -> None:
+        """Start the listener thread once; later calls are no-ops.
+
+        Guarded by its own lock: ``_lock`` is also taken on the event loop
+        by ``subscribe``/``unsubscribe`` and must never wait on the database.
+        """
+        with self._start_lock:
+            if self._thread is not None and self._thread.is_alive():
+                if not self._stop.is_set():
+                    return
+                # The last subscriber just left; let that thread finish first
+                self._thread.join()
+            self._session_factory = session_factory
+            with session_factory() as db:
+                self._max_seen = db.scalar(select(func.max(RequestEvent.id))) or 0
+            self._seen.clear()
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="event-listener", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the listener thread and wait for it (app shutdown, tests)."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_seconds + 1)
+        self._thread = None
+
+    def wake(self) -> None:
+        """Ask the listener to look for new events now instead of waiting."""
+        self._wake.set()
+
+    def _run(self) -> None:
+        engine = self._session_factory.kw["bind"]
+        while not self._stop.is_set():
+            try:
+                if engine.dialect.name == "postgresql":
+                    self._listen(engine)
+                else:
+                    self._poll()
+            except Exception as exc:
+                logger.error("Event listener failed, retrying: %s", exc)
+                self._stop.wait(self.poll_seconds)
+
+    def _poll(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.poll_seconds)
+            self._wake.clear()
+            self._dispatch_new()
+
+    def _listen(self, engine) -> None:
+        # LISTEN is session state, so it needs its own autocommit connection
+        # (a direct URL, not a transaction-mode pooler).  The connection is
+        # invalidated on exit so it is never handed back to the ORM pool.
+        if settings.database_direct_url:
+            engine = create_engine(
+                settings.database_direct_url,
+                connect_args={"sslmode": "require"},
+                poolclass=NullPool,
+            )
+        conn = engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+        try:
+            conn.exec_driver_sql(f"LISTEN {EVENTS_CHANNEL}")
+            driver = conn.connection.driver_connection
+            last_dispatch = time.monotonic()
+            while not self._stop.is_set():
+                # The short timeout only re-checks the stop flag; the database
+                # is queried on a notify or, rarely, as a safety net
+                io_select.select([driver], [], [], self.poll_seconds)
+                driver.poll()
+                notified = bool(driver.notifies)
+                driver.notifies.clear()
+                self._wake.clear()
+                overdue = (
+                    time.monotonic() - last_dispatch
+                    >= settings.event_safety_poll_seconds
+                )
+                if notified or overdue:
+                    self._dispatch_new()
+                    last_dispatch = time.monotonic()
+        finally:
+            conn.invalidate()
+            conn.close()
+
+    def _dispatch_new(self) -> None:
+        floor = max(0, self._max_seen - RESCAN_WINDOW)
+        with self._session_factory() as db:
+            # Rescan ids only; payloads are loaded just for unseen events
+            ids = db.scalars(
+                select(RequestEvent.id).where(RequestEvent.id > floor)
+            ).all()
+            new_ids = [i for i in ids if i not in self._seen]
+            if not new_ids:
+                return
+            rows = db.scalars(
+                select(RequestEvent)
+                .where(RequestEvent.id.in_(new_ids))
+                .order_by(RequestEvent.id)
+            ).all()
+            events = [_to_dict(row) for row in rows]
+
+        for event in events:
+            self._seen.add(event["id"])
+            self._max_seen = max(self._max_seen, event["id"])
+            self._publish(event)
+        self._seen = {i for i in self._seen if i > self._max_seen - RESCAN_WINDOW}
+
+    # ── Subscribers ────────────────────────────────────────────────
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register a queue on the running event loop for new events."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        with self._lock:
+            self._subscribers[queue] = asyncio.get_running_loop()
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Drop a queue; the listener stops once nobody is subscribed."""
+        with self._lock:
+            self._subscribers.pop(queue, None)
+            if not self._subscribers:
+                # Signal only: joining here would block the event loop
+                self._stop.set()
+                self._wake.set()
+
+    def _publish(self, event: dict) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.items())
+        for queue, loop in subscribers:
+            try:
+                loop.call_soon_threadsafe(_offer, queue, event)
+            except RuntimeError:
+                # The client's event loop has shut down
+                self.unsubscribe(queue)
+
+    def load_since(self, last_event_id: int) -> list[dict]:
+        """Return stored events newer than ``last_event_id``, oldest first.
+
+        If events after ``last_event_id`` have already been trimmed from the
+        history (or the id is unknown), a single ``reset`` event carrying the
+        newest id is returned instead: the client must refetch its state.
+        """
+        with self._session_factory() as db:
+            oldest, newest = db.execute(
+                select(func.min(RequestEvent.id), func.max(RequestEvent.id))
+            ).one()
+            if (oldest is not None and oldest > last_event_id + 1) or (
+                last_event_id > (newest or 0)
+            ):
+                return [{"id": newest or 0, "event": RESET_EVENT, "data": {}}]
+            rows = db.scalars(
+                select(RequestEvent)
+                .where(RequestEvent.id > last_event_id)
+                .order_by(RequestEvent.id)
+                .limit(settings.event_history_size)
+            ).all()
+            return [_to_dict(row) for row in rows]
+
+    async def stream(
+        self,
+        session_factory: sessionmaker,
+        is_disconnected: Callable[[], Awaitable[bool]],
+        last_event_id: int | None = None,
+    ) -> AsyncIterator[str]:
+        """Yield SSE messages: missed events first, then live ones.
+
+        A comment line is sent whenever no event arrives within the
+        heartbeat interval so proxies keep the connection open.  The
+        listener is started after subscribing, so a concurrent last
+        unsubscribe cannot leave this stream without one.
+        """
+        queue = self.subscribe()
+        try:
+            await run_in_threadpool(self.ensure_started, session_factory)
+            yield f"retry: {RETRY_MS}\n\n"
+
+            replayed: set[int] = set()
+            floor = 0
+            if last_event_id is not None:
+                for event in await run_in_threadpool(self.load_since, last_event_id):
+                    if event["event"] == RESET_EVENT:
+                        # The client refetches everything up to this id
+                        floor = event["id"]
+                    replayed.add(event["id"])
+                    yield format_sse(event)
+
+            while not await is_disconnected():
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(), timeout=self.heartbeat_seconds
+                    )
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+                    continue
+                if event["id"] > floor and event["id"] not in replayed:
+                    yield format_sse(event)
+        finally:
+            self.unsubscribe(queue)
+
+
+def _offer(queue: asyncio.Queue, event: dict) -> None:
+    try:
+        queue.put_nowait(event)
+    except asyncio.QueueFull:
+        logger.warning("Dropping event %d for a slow SSE client.", event["id"])
+
+
+# One listener per process, shared by every SSE connection to this instance
+broadcaster = EventBroadcaster(
+    heartbeat_seconds=settings.event_heartbeat_seconds,
+    poll_seconds=settings.event_poll_seconds,
+)
@@ -1,15 +1,35 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api.endpoints import analytics_router, router as requests_router
+from app.api.endpoints import (
+    analytics_router,
+    events_router,
+    router as requests_router,
+)
+from app.cache import hot_set
 from app.core.config import settings
-from app.database import Base, engine
+from app.database import Base, engine, upgrade_schema
+from app.events import broadcaster
 
 Base.metadata.create_all(bind=engine)
+upgrade_schema(engine)
+
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    # Stop the live-feed listener so its LISTEN connection is closed
+    broadcaster.stop()
+
 
 app = FastAPI(
     title="Maintenance Request Tracker API",
     redirect_slashes=False,
+    lifespan=lifespan,
 )
 
 # Support comma-separated origins so localhost + Vercel production both work.
@@ -25,8 +45,15 @@ app.add_middleware(
 
 app.include_router(requests_router, prefix="/api/requests")
 app.include_router(analytics_router, prefix="/api/analytics/stats")
+app.include_router(events_router, prefix="/api/events")
 
 
 @app.get("/")
 def read_root() -> dict[str, str]:
-    return {"message": "Welcome to MRT API - Server is Running!"}
\ No newline at end of file
+    return {"message": "Welcome to MRT API - Server is Running!"}
+
+
+@app.get("/api/health")
+def read_health() -> dict[str, dict[str, int]]:
+    """Report this instance's in-memory footprint for operators."""
+    return {"hot_cache": hot_set.footprint()}
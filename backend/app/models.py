@@ -1,7 +1,16 @@
 import enum
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, Enum, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    DateTime,
+    Enum,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    event,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -23,12 +32,9 @@ class Status(str, enum.Enum):
     COMPLETED = "Completed"
 
 
-class MaintenanceRequest(Base):
-    """SQLAlchemy model representing a maintenance request."""
-
-    __tablename__ = "maintenance_requests"
+class _RequestColumns:
+    """Columns shared by live and archived maintenance requests."""
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
     category: Mapped[str | None] = mapped_column(
@@ -48,9 +54,124 @@ class MaintenanceRequest(Base):
         nullable=False,
         default=lambda: datetime.now(timezone.utc),
     )
+    # Set when the request becomes Completed (and cleared if it is reopened);
+    # the archiver ages requests by this rather than by ``created_at``
+    completed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, default=None
+    )
+    # Bumped on every update; clients echo it back for optimistic locking
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default="1"
+    )
+
+
+class MaintenanceRequest(_RequestColumns, Base):
+    """SQLAlchemy model representing a maintenance request."""
+
+    __tablename__ = "maintenance_requests"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
 
     def __repr__(self) -> str:
         return (
             f"<MaintenanceRequest(id={self.id}, title='{self.title}', "
             f"status='{self.status}')>"
         )
+
+
+class ArchivedMaintenanceRequest(_RequestColumns, Base):
+    """Completed request moved out of the live table by the archiver.
+
+    Keeps the original ``id`` so archived rows stay addressable.
+    """
+
+    __tablename__ = "maintenance_requests_archive"
+
+    id: Mapped[int] = mapped_column(
+        Integer, primary_key=True, autoincrement=False
+    )
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ArchivedMaintenanceRequest(id={self.id}, title='{self.title}')>"
+        )
+
+
+class ArchivedAggregate(Base):
+    """Running request counts per (category, priority) for archived rows.
+
+    Analytics add these to the live-table aggregates so totals stay
+    correct without scanning the archive.  Uncategorized requests are
+    stored under ``UNCATEGORIZED`` rather than NULL so the unique
+    constraint (and the archiver's upsert) covers them too.
+    """
+
+    __tablename__ = "maintenance_requests_archive_stats"
+
+    UNCATEGORIZED = ""
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    category: Mapped[str] = mapped_column(String(100), nullable=False)
+    priority: Mapped[str] = mapped_column(Enum(Priority), nullable=False)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    __table_args__ = (UniqueConstraint("category", "priority"),)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ArchivedAggregate(category='{self.category}', "
+            f"priority='{self.priority}', count={self.count})>"
+        )
+
+
+class DatasetVersion(Base):
+    """Single-row counter bumped on every write to ``maintenance_requests``.
+
+    Lets each instance detect a stale in-process cache with one primary-key
+    lookup instead of re-running the count and list queries.
+    """
+
+    __tablename__ = "maintenance_requests_version"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, default=1)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<DatasetVersion(version={self.version})>"
+
+
+@event.listens_for(DatasetVersion.__table__, "after_create")
+def _seed_dataset_version(target, connection, **kw) -> None:
+    """Create the single counter row with the table.
+
+    Seeding here rather than on first write avoids two concurrent first
+    creates both inserting ``id=1``.
+    """
+    connection.execute(target.insert().values(id=1, version=0))
+
+
+class RequestEvent(Base):
+    """Outbox row for the live event feed, written with the change it describes.
+
+    The auto-increment ``id`` doubles as the SSE event id, so clients can
+    resume from ``Last-Event-ID`` against any instance.
+    """
+
+    __tablename__ = "request_events"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    event: Mapped[str] = mapped_column(String(50), nullable=False)
+    data: Mapped[dict] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+
+    def __repr__(self) -> str:
+        return f"<RequestEvent(id={self.id}, event='{self.event}')>"
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from app.models import Priority, Status
 
@@ -42,6 +42,60 @@ class RequestResponse(BaseModel):
     priority: Priority
     status: Status
     created_at: datetime
+    completed_at: datetime | None = None
+    version: int = 1
+
+
+class _LifecycleChange(BaseModel):
+    """Status and/or priority change shared by single and batch updates."""
+
+    status: Status | None = Field(default=None, examples=[Status.COMPLETED])
+    priority: Priority | None = Field(default=None, examples=[Priority.HIGH])
+
+    @model_validator(mode="after")
+    def _require_change(self):
+        if self.status is None and self.priority is None:
+            raise ValueError("Provide at least one of 'status' or 'priority'.")
+        return self
+
+    def changes(self) -> dict:
+        """Return only the fields that should be written."""
+        return self.model_dump(include={"status", "priority"}, exclude_none=True)
+
+
+class RequestUpdate(_LifecycleChange):
+    """Schema for updating one request's status and/or priority.
+
+    When ``version`` is given the update only applies if the row is still
+    at that version; otherwise the request is rejected with 409.
+    """
+
+    version: int | None = Field(default=None, ge=1, examples=[1])
+
+
+class BatchUpdateItem(BaseModel):
+    """One target of a batch update, optionally pinned to a version."""
+
+    id: int
+    version: int | None = Field(default=None, ge=1)
+
+
+class BatchUpdate(_LifecycleChange):
+    """Schema for applying the same change to many requests at once."""
+
+    items: list[BatchUpdateItem] = Field(..., min_length=1, max_length=10_000)
+
+
+class BatchUpdateResult(BaseModel):
+    """Outcome of a batch update.
+
+    ``conflicts`` lists ids whose version no longer matched and
+    ``not_found`` ids that do not exist in the live table.
+    """
+
+    updated: list[RequestResponse]
+    conflicts: list[int] = []
+    not_found: list[int] = []
 
 
 class PaginatedResponse(BaseModel):
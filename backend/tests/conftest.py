@@ -34,7 +34,9 @@ _mock_suggest.start()
 _mock_summary.start()
 
 # NOW it is safe to import app code
-from app.database import Base, get_db  # noqa: E402
+from app.cache import hot_set  # noqa: E402
+from app.database import Base, get_db, get_session_factory  # noqa: E402
+from app.events import broadcaster  # noqa: E402
 from app.main import app  # noqa: E402
 
 # ── In-memory SQLite engine ────────────────────────────────────────
@@ -61,6 +63,7 @@ def _override_get_db() -> Generator[Session, None, None]:
 
 # Replace the production DB dependency with the test one
 app.dependency_overrides[get_db] = _override_get_db
+app.dependency_overrides[get_session_factory] = lambda: TestingSessionLocal
 
 
 # ── Fixtures ───────────────────────────────────────────────────────
@@ -69,7 +72,9 @@ app.dependency_overrides[get_db] = _override_get_db
 def _setup_tables():
     """Create all tables before each test, drop them after."""
     Base.metadata.create_all(bind=test_engine)
+    hot_set.invalidate()
     yield
+    broadcaster.stop()
     Base.metadata.drop_all(bind=test_engine)
 
 
@@ -87,3 +92,9 @@ def db_session() -> Generator[Session, None, None]:
         yield session
     finally:
         session.close()
+
+
+@pytest.fixture()
+def session_factory() -> sessionmaker:
+    """Return the session factory used by background work in tests."""
+    return TestingSessionLocal
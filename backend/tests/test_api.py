@@ -1,6 +1,25 @@
 """Unit tests for the Maintenance Request Tracker API endpoints."""
 
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.cache import HotSetCache, hot_set
+from app.core.config import settings
+from app.crud import archive_completed_requests
+from app.database import upgrade_schema
+from app.events import broadcaster
+from app.models import (
+    ArchivedAggregate,
+    ArchivedMaintenanceRequest,
+    DatasetVersion,
+    MaintenanceRequest,
+    RequestEvent,
+)
 
 # ── Sample payloads ────────────────────────────────────────────────
 
@@ -152,6 +171,461 @@ class TestAnalytics:
         assert data["most_common_category"] == "Plumbing"
 
 
+# ── PATCH /api/requests/{id} and POST /api/requests/batch-update ─
+
+class TestUpdateRequests:
+    """Tests for single and batch lifecycle updates."""
+
+    def test_patch_updates_status_and_bumps_version(self, client: TestClient):
+        created = client.post("/api/requests", json=SAMPLE_REQUEST).json()
+
+        response = client.patch(
+            f"/api/requests/{created['id']}",
+            json={"status": "In Progress", "version": created["version"]},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "In Progress"
+        assert data["priority"] == "Low"
+        assert data["version"] == created["version"] + 1
+
+    def test_patch_stale_version_returns_409(self, client: TestClient):
+        created = client.post("/api/requests", json=SAMPLE_REQUEST).json()
+        client.patch(f"/api/requests/{created['id']}", json={"status": "Completed"})
+
+        response = client.patch(
+            f"/api/requests/{created['id']}",
+            json={"priority": "High", "version": created["version"]},
+        )
+        assert response.status_code == 409
+
+    def test_patch_missing_request_returns_404(self, client: TestClient):
+        response = client.patch("/api/requests/999", json={"status": "Completed"})
+        assert response.status_code == 404
+
+    def test_patch_requires_a_change(self, client: TestClient):
+        created = client.post("/api/requests", json=SAMPLE_REQUEST).json()
+        response = client.patch(f"/api/requests/{created['id']}", json={})
+        assert response.status_code == 422
+
+    def test_batch_update_reports_conflicts(self, client: TestClient):
+        first = client.post("/api/requests", json=SAMPLE_REQUEST).json()
+        second = client.post("/api/requests", json=SAMPLE_REQUEST).json()
+
+        response = client.post(
+            "/api/requests/batch-update",
+            json={
+                "items": [
+                    {"id": first["id"]},
+                    {"id": second["id"], "version": second["version"] + 1},
+                    {"id": 999},
+                ],
+                "status": "Completed",
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["id"] for item in data["updated"]] == [first["id"]]
+        assert data["updated"][0]["status"] == "Completed"
+        assert data["conflicts"] == [second["id"]]
+        assert data["not_found"] == [999]
+
+    def test_batch_update_keeps_list_and_analytics_consistent(
+        self, client: TestClient, db_session: Session
+    ):
+        ids = [
+            client.post("/api/requests", json=SAMPLE_REQUEST).json()["id"]
+            for _ in range(3)
+        ]
+        client.get("/api/requests")
+
+        client.post(
+            "/api/requests/batch-update",
+            json={"items": [{"id": i} for i in ids[:2]], "priority": "High"},
+        )
+
+        items = client.get("/api/requests").json()["items"]
+        assert [item["priority"] for item in items] == ["Low", "High", "High"]
+        stats = client.get("/api/analytics/stats").json()
+        assert stats["high_priority_count"] == 2
+
+        event = db_session.query(RequestEvent).order_by(RequestEvent.id.desc()).first()
+        assert event.event == "requests.updated"
+        assert event.data["stats"]["high_priority_count"] == 2
+        assert event.data["requests"][0] == {
+            "id": ids[0],
+            "status": "Pending",
+            "priority": "High",
+            "version": 2,
+        }
+
+    def test_status_only_batch_leaves_high_priority_delta_at_zero(
+        self, client: TestClient, db_session: Session
+    ):
+        ids = [
+            client.post("/api/requests", json=HIGH_PRIORITY_REQUEST).json()["id"]
+            for _ in range(2)
+        ]
+
+        client.post(
+            "/api/requests/batch-update",
+            json={"items": [{"id": i} for i in ids], "status": "Completed"},
+        )
+
+        event = db_session.query(RequestEvent).order_by(RequestEvent.id.desc()).first()
+        assert event.event == "requests.updated"
+        assert event.data["stats"]["high_priority_count"] == 0
+        stats = client.get("/api/analytics/stats").json()
+        assert stats["high_priority_count"] == 2
+
+    def test_large_batch_event_sends_refetch_hint(
+        self, client: TestClient, db_session: Session, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "event_max_changes", 1)
+        ids = [
+            client.post("/api/requests", json=SAMPLE_REQUEST).json()["id"]
+            for _ in range(2)
+        ]
+
+        client.post(
+            "/api/requests/batch-update",
+            json={"items": [{"id": i} for i in ids], "status": "Completed"},
+        )
+
+        event = db_session.query(RequestEvent).order_by(RequestEvent.id.desc()).first()
+        assert event.data["requests"] is None
+
+    def test_upgrade_schema_adds_missing_columns(self):
+        engine = create_engine("sqlite://")
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "CREATE TABLE maintenance_requests "
+                    "(id INTEGER, status VARCHAR(11), created_at VARCHAR(32))"
+                )
+            )
+            conn.execute(
+                text(
+                    "INSERT INTO maintenance_requests VALUES "
+                    "(1, 'COMPLETED', '2024-01-01'), (2, 'PENDING', '2024-01-01')"
+                )
+            )
+
+        upgrade_schema(engine)
+        upgrade_schema(engine)
+
+        with engine.connect() as conn:
+            rows = conn.execute(
+                text(
+                    "SELECT version, completed_at FROM maintenance_requests "
+                    "ORDER BY id"
+                )
+            ).all()
+        assert [tuple(row) for row in rows] == [(1, "2024-01-01"), (1, None)]
+
+
+# ── Hot-set cache ─────────────────────────────────────────────────
+
+class TestHotSetCache:
+    """Tests for the in-process cache behind the list endpoint."""
+
+    def test_first_page_served_from_cache(
+        self, client: TestClient, db_session: Session
+    ):
+        client.post("/api/requests", json=SAMPLE_REQUEST)
+        client.get("/api/requests")
+
+        # Remove the row behind the cache's back without bumping the version
+        db_session.query(MaintenanceRequest).delete()
+        db_session.commit()
+
+        data = client.get("/api/requests").json()
+        assert data["total"] == 1
+        assert data["items"][0]["title"] == SAMPLE_REQUEST["title"]
+        assert hot_set.footprint()["size"] == 1
+
+    def test_create_writes_through(self, client: TestClient):
+        client.get("/api/requests")
+        client.post("/api/requests", json=SAMPLE_REQUEST)
+        client.post("/api/requests", json=HIGH_PRIORITY_REQUEST)
+
+        data = client.get("/api/requests").json()
+        assert data["total"] == 2
+        assert data["items"][0]["title"] == HIGH_PRIORITY_REQUEST["title"]
+        assert hot_set.footprint()["size"] == 2
+
+    def test_version_bump_invalidates(
+        self, client: TestClient, db_session: Session
+    ):
+        """A write from another instance bumps the version and forces a reload."""
+        client.post("/api/requests", json=SAMPLE_REQUEST)
+        client.get("/api/requests")
+
+        db_session.query(MaintenanceRequest).delete()
+        db_session.get(DatasetVersion, 1).version += 1
+        db_session.commit()
+
+        data = client.get("/api/requests").json()
+        assert data["total"] == 0
+        assert data["items"] == []
+
+    def test_version_row_seeded_with_table(self, db_session: Session):
+        assert db_session.get(DatasetVersion, 1).version == 0
+
+    def test_footprint_reported_on_health(self, client: TestClient):
+        client.post("/api/requests", json=SAMPLE_REQUEST)
+        client.get("/api/requests")
+
+        data = client.get("/api/health").json()["hot_cache"]
+        assert data["capacity"] == hot_set.capacity
+        assert data["size"] == 1
+        assert data["bytes"] > 0
+
+    def test_capacity_is_fixed(self):
+        cache = HotSetCache(capacity=2)
+        cache.load(1, [{"id": 2}, {"id": 1}], total=2)
+        cache.push(2, {"id": 3})
+
+        items, total = cache.get(2)
+        assert [item["id"] for item in items] == [3, 2]
+        assert total == 3
+        assert cache.footprint()["capacity"] == 2
+
+    def test_byte_budget_evicts_oldest(self):
+        rows = [{"id": i, "description": "x" * 1000} for i in (3, 2, 1)]
+        cache = HotSetCache(capacity=10, max_bytes=3000)
+        cache.load(1, rows, total=3)
+        cache.push(2, {"id": 4, "description": "x" * 1000})
+
+        items, total = cache.get(2)
+        assert [item["id"] for item in items] == [4, 3]
+        assert total == 4
+
+    def test_page_past_byte_budget_read_from_database(
+        self, client: TestClient, monkeypatch
+    ):
+        monkeypatch.setattr(hot_set, "max_bytes", 1)
+        client.post("/api/requests", json=SAMPLE_REQUEST)
+        client.post("/api/requests", json=HIGH_PRIORITY_REQUEST)
+
+        data = client.get("/api/requests").json()
+        assert hot_set.footprint()["size"] == 0
+        assert [item["title"] for item in data["items"]] == [
+            HIGH_PRIORITY_REQUEST["title"],
+            SAMPLE_REQUEST["title"],
+        ]
+
+
+# ── Archiving ─────────────────────────────────────────────────────
+
+def _age_all_requests(db_session: Session, days: int) -> None:
+    """Backdate every live request so it falls past the archive cutoff."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    db_session.query(MaintenanceRequest).update({"created_at": cutoff})
+    db_session.query(MaintenanceRequest).filter(
+        MaintenanceRequest.completed_at.is_not(None)
+    ).update({"completed_at": cutoff})
+    db_session.commit()
+
+
+class TestArchive:
+    """Tests for moving completed requests out of the live table."""
+
+    def test_only_old_completed_requests_archived(
+        self, client: TestClient, db_session: Session
+    ):
+        client.post("/api/requests", json={**SAMPLE_REQUEST, "status": "Completed"})
+        client.post("/api/requests", json=SAMPLE_REQUEST)
+        _age_all_requests(db_session, days=120)
+        client.post("/api/requests", json={**SAMPLE_REQUEST, "status": "Completed"})
+
+        archived = archive_completed_requests(
+            db_session, older_than=timedelta(days=90), batch_size=1
+        )
+
+        assert archived == 1
+        assert db_session.query(MaintenanceRequest).count() == 2
+        assert db_session.query(ArchivedMaintenanceRequest).count() == 1
+
+    def test_recently_completed_old_request_not_archived(
+        self, client: TestClient, db_session: Session
+    ):
+        created = client.post("/api/requests", json=SAMPLE_REQUEST).json()
+        _age_all_requests(db_session, days=120)
+        completed = client.patch(
+            f"/api/requests/{created['id']}", json={"status": "Completed"}
+        ).json()
+
+        assert completed["completed_at"] is not None
+        assert archive_completed_requests(
+            db_session, older_than=timedelta(days=90)
+        ) == 0
+
+    def test_archive_is_resumable(self, client: TestClient, db_session: Session):
+        for _ in range(3):
+            client.post(
+                "/api/requests", json={**SAMPLE_REQUEST, "status": "Completed"}
+            )
+        _age_all_requests(db_session, days=120)
+
+        assert archive_completed_requests(
+            db_session, older_than=timedelta(days=90), batch_size=2
+        ) == 3
+        assert archive_completed_requests(
+            db_session, older_than=timedelta(days=90)
+        ) == 0
+
+    def test_uncategorized_counts_upserted_into_one_row(
+        self, client: TestClient, db_session: Session
+    ):
+        for _ in range(2):
+            client.post(
+                "/api/requests", json={**SAMPLE_REQUEST, "status": "Completed"}
+            )
+        db_session.query(MaintenanceRequest).update({"category": None})
+        db_session.commit()
+        _age_all_requests(db_session, days=120)
+
+        archive_completed_requests(
+            db_session, older_than=timedelta(days=90), batch_size=1
+        )
+
+        row = db_session.query(ArchivedAggregate).one()
+        assert row.category == ArchivedAggregate.UNCATEGORIZED
+        assert row.count == 2
+        stats = client.get("/api/analytics/stats").json()
+        assert stats["total_requests"] == 2
+        assert stats["most_common_category"] is None
+
+    def test_analytics_include_archived_aggregates(
+        self, client: TestClient, db_session: Session
+    ):
+        client.post(
+            "/api/requests", json={**HIGH_PRIORITY_REQUEST, "status": "Completed"}
+        )
+        client.post("/api/requests", json={**SAMPLE_REQUEST, "status": "Completed"})
+        _age_all_requests(db_session, days=120)
+        client.post("/api/requests", json=SAMPLE_REQUEST)
+        before = client.get("/api/analytics/stats").json()
+
+        archive_completed_requests(db_session, older_than=timedelta(days=90))
+
+        assert client.get("/api/analytics/stats").json() == before
+        assert before["total_requests"] == 3
+        assert before["high_priority_count"] == 1
+
+    def test_list_include_archived(self, client: TestClient, db_session: Session):
+        client.post("/api/requests", json={**SAMPLE_REQUEST, "status": "Completed"})
+        _age_all_requests(db_session, days=120)
+        client.post("/api/requests", json=HIGH_PRIORITY_REQUEST)
+        client.get("/api/requests")
+
+        archive_completed_requests(db_session, older_than=timedelta(days=90))
+
+        live = client.get("/api/requests").json()
+        assert live["total"] == 1
+
+        data = client.get("/api/requests", params={"include_archived": True}).json()
+        assert data["total"] == 2
+        assert [item["title"] for item in data["items"]] == [
+            HIGH_PRIORITY_REQUEST["title"],
+            SAMPLE_REQUEST["title"],
+        ]
+        assert data["items"][1]["status"] == "Completed"
+
+
+# ── GET /api/events ───────────────────────────────────────────────
+
+async def _never_disconnected() -> bool:
+    return False
+
+
+async def _disconnected() -> bool:
+    return True
+
+
+class TestEvents:
+    """Tests for the live event feed."""
+
+    def test_create_records_event_with_stats_delta(
+        self, client: TestClient, db_session: Session
+    ):
+        created = client.post("/api/requests", json=HIGH_PRIORITY_REQUEST).json()
+
+        event = db_session.query(RequestEvent).one()
+        assert event.event == "request.created"
+        assert event.data["request"]["id"] == created["id"]
+        assert event.data["stats"] == {
+            "total_requests": 1,
+            "high_priority_count": 1,
+            "categories": {"Plumbing": 1},
+        }
+
+    def test_stream_resumes_from_last_event_id(
+        self, client: TestClient, session_factory: sessionmaker
+    ):
+        client.post("/api/requests", json=SAMPLE_REQUEST)
+        client.post("/api/requests", json=HIGH_PRIORITY_REQUEST)
+        async def collect() -> list[str]:
+            stream = broadcaster.stream(session_factory, _disconnected, 1)
+            return [chunk async for chunk in stream]
+
+        chunks = asyncio.run(collect())
+        assert chunks[0].startswith("retry:")
+        assert len(chunks) == 2
+        assert chunks[1].startswith("id: 2\nevent: request.created\n")
+        assert HIGH_PRIORITY_REQUEST["title"] in chunks[1]
+
+    def test_stream_resets_when_missed_events_were_trimmed(
+        self, client: TestClient, session_factory: sessionmaker, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "event_history_size", 1)
+        for _ in range(3):
+            client.post("/api/requests", json=SAMPLE_REQUEST)
+        async def collect() -> list[str]:
+            stream = broadcaster.stream(session_factory, _disconnected, 1)
+            return [chunk async for chunk in stream]
+
+        chunks = asyncio.run(collect())
+        assert chunks[1:] == ["id: 3\nevent: reset\ndata: {}\n\n"]
+
+    def test_listener_stops_with_last_subscriber(
+        self, session_factory: sessionmaker
+    ):
+        async def open_and_close():
+            stream = broadcaster.stream(session_factory, _never_disconnected)
+            await anext(stream)
+            thread = broadcaster._thread
+            await stream.aclose()
+            return thread
+
+        thread = asyncio.run(open_and_close())
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+
+    def test_new_request_pushed_to_subscribers(
+        self, client: TestClient, session_factory: sessionmaker
+    ):
+        async def next_event() -> str:
+            stream = broadcaster.stream(session_factory, _never_disconnected)
+            assert (await anext(stream)).startswith("retry:")
+            waiter = asyncio.ensure_future(anext(stream))
+            await asyncio.sleep(0)
+            await asyncio.to_thread(
+                client.post, "/api/requests", json=SAMPLE_REQUEST
+            )
+            try:
+                return await asyncio.wait_for(waiter, timeout=5)
+            finally:
+                await stream.aclose()
+
+        message = asyncio.run(next_event())
+        assert message.startswith("id: 1\nevent: request.created\n")
+        data = json.loads(message.split("data: ", 1)[1])
+        assert data["request"]["title"] == SAMPLE_REQUEST["title"]
+        assert data["stats"]["total_requests"] == 1
+
+
 # ── Root health check ─────────────────────────────────────────────
 
 class TestRoot:
@@ -13,6 +13,7 @@ import {
   CardTitle,
 } from '@/components/ui/card';
 import { useAnalytics } from '@/hooks/use-analytics';
+import { useRequestEvents } from '@/hooks/use-request-events';
 import { useRequests } from '@/hooks/use-requests';
 
 export default function DashboardPage() {
@@ -24,9 +25,38 @@ export default function DashboardPage() {
     pages,
     total,
     setPage,
+    applyCreated,
+    refresh,
+    applyUpdated,
     createRequest,
   } = useRequests();
-  const { stats, isLoading: statsLoading } = useAnalytics();
+  const {
+    stats,
+    isLoading: statsLoading,
+    applyDelta,
+    refresh: refreshStats,
+  } = useAnalytics();
+
+  // Live updates from every dashboard, including this one
+  useRequestEvents(
+    (event) => {
+      applyCreated(event.request);
+      applyDelta(event.stats);
+    },
+    (event) => {
+      if (event.requests) {
+        applyUpdated(event.requests);
+      } else {
+        refresh();
+      }
+      applyDelta(event.stats);
+    },
+    () => {
+      // Missed events were trimmed server-side; start over from the API
+      refresh();
+      refreshStats();
+    },
+  );
 
   return (
     <div className="min-h-screen bg-slate-50">
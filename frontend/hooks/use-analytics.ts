@@ -2,13 +2,14 @@
 
 import { useCallback, useEffect, useState } from 'react';
 import api from '@/lib/api';
-import type { AnalyticsStats } from '@/types';
+import type { AnalyticsStats, StatsDelta } from '@/types';
 
 interface UseAnalyticsReturn {
   stats: AnalyticsStats | null;
   isLoading: boolean;
   error: string | null;
   refresh: () => Promise<void>;
+  applyDelta: (delta: StatsDelta) => void;
 }
 
 export function useAnalytics(): UseAnalyticsReturn {
@@ -35,5 +36,25 @@ export function useAnalytics(): UseAnalyticsReturn {
     fetchStats();
   }, [fetchStats]);
 
-  return { stats, isLoading, error, refresh: fetchStats };
+  const applyDelta = useCallback(
+    (delta: StatsDelta) => {
+      setStats((prev) =>
+        prev && {
+          ...prev,
+          total_requests: prev.total_requests + delta.total_requests,
+          high_priority_count:
+            prev.high_priority_count + delta.high_priority_count,
+        },
+      );
+      // Per-category counts are not kept client-side, so only refetch when
+      // a category other than the current leader might have overtaken it
+      const leader = stats?.most_common_category;
+      if (Object.keys(delta.categories).some((c) => c !== leader)) {
+        fetchStats();
+      }
+    },
+    [stats, fetchStats],
+  );
+
+  return { stats, isLoading, error, refresh: fetchStats, applyDelta };
 }
@@ -0,0 +1,51 @@
+'use client';
+
+import { useEffect, useRef } from 'react';
+import type { RequestCreatedEvent, RequestsUpdatedEvent } from '@/types';
+
+const EVENTS_URL = `${process.env.NEXT_PUBLIC_API_URL || ''}/api/events`;
+
+/**
+ * Subscribe to the server's live feed (GET /api/events).
+ * EventSource reconnects on its own and resumes via Last-Event-ID; if the
+ * missed events are no longer stored, the server sends `reset` and the
+ * caller must refetch its data.
+ */
+export function useRequestEvents(
+  onCreated: (event: RequestCreatedEvent) => void,
+  onUpdated: (event: RequestsUpdatedEvent) => void,
+  onReset: () => void,
+): void {
+  const onCreatedRef = useRef(onCreated);
+  const onUpdatedRef = useRef(onUpdated);
+  const onResetRef = useRef(onReset);
+
+  useEffect(() => {
+    onCreatedRef.current = onCreated;
+    onUpdatedRef.current = onUpdated;
+    onResetRef.current = onReset;
+  }, [onCreated, onUpdated, onReset]);
+
+  useEffect(() => {
+    const source = new EventSource(EVENTS_URL);
+    const handleCreated = (message: MessageEvent<string>) => {
+      onCreatedRef.current(JSON.parse(message.data) as RequestCreatedEvent);
+    };
+    const handleUpdated = (message: MessageEvent<string>) => {
+      onUpdatedRef.current(JSON.parse(message.data) as RequestsUpdatedEvent);
+    };
+    const handleReset = () => {
+      onResetRef.current();
+    };
+
+    source.addEventListener('request.created', handleCreated);
+    source.addEventListener('requests.updated', handleUpdated);
+    source.addEventListener('reset', handleReset);
+    return () => {
+      source.removeEventListener('request.created', handleCreated);
+      source.removeEventListener('requests.updated', handleUpdated);
+      source.removeEventListener('reset', handleReset);
+      source.close();
+    };
+  }, []);
+}
@@ -1,11 +1,12 @@
 'use client';
 
-import { useCallback, useEffect, useState } from 'react';
+import { useCallback, useEffect, useRef, useState } from 'react';
 import api from '@/lib/api';
 import type {
   MaintenanceRequest,
   MaintenanceRequestCreate,
   PaginatedResponse,
+  RequestChange,
 } from '@/types';
 
 const PAGE_SIZE = 5;
@@ -19,6 +20,8 @@ interface UseRequestsReturn {
   total: number;
   setPage: (page: number) => void;
   refresh: () => Promise<void>;
+  applyCreated: (request: MaintenanceRequest) => void;
+  applyUpdated: (changes: RequestChange[]) => void;
   createRequest: (
     data: MaintenanceRequestCreate,
   ) => Promise<MaintenanceRequest>;
@@ -29,8 +32,12 @@ export function useRequests(): UseRequestsReturn {
   const [isLoading, setIsLoading] = useState<boolean>(true);
   const [error, setError] = useState<string | null>(null);
   const [page, setPage] = useState<number>(1);
-  const [pages, setPages] = useState<number>(1);
   const [total, setTotal] = useState<number>(0);
+  // Ids already counted, so the POST response and its live event
+  // for the same request are only applied once
+  const appliedIds = useRef<Set<number>>(new Set());
+
+  const pages = Math.max(1, Math.ceil(total / PAGE_SIZE));
 
   const fetchRequests = useCallback(async () => {
     try {
@@ -40,9 +47,9 @@ export function useRequests(): UseRequestsReturn {
       const { data } = await api.get<PaginatedResponse>('/api/requests', {
         params: { skip, limit: PAGE_SIZE },
       });
+      appliedIds.current = new Set(data.items.map((item) => item.id));
       setRequests(data.items);
       setTotal(data.total);
-      setPages(data.pages);
     } catch (err) {
       const message =
         err instanceof Error ? err.message : 'Failed to fetch requests';
@@ -56,18 +63,49 @@ export function useRequests(): UseRequestsReturn {
     fetchRequests();
   }, [fetchRequests]);
 
+  const applyCreated = useCallback(
+    (request: MaintenanceRequest) => {
+      if (appliedIds.current.has(request.id)) return;
+      appliedIds.current.add(request.id);
+
+      setTotal((prev) => prev + 1);
+      // Newest first: only page 1 shows the new record
+      if (page === 1) {
+        setRequests((prev) => [request, ...prev].slice(0, PAGE_SIZE));
+      }
+    },
+    [page],
+  );
+
+  const applyUpdated = useCallback((changes: RequestChange[]) => {
+    const byId = new Map(changes.map((change) => [change.id, change]));
+    setRequests((prev) =>
+      prev.map((request) => {
+        const change = byId.get(request.id);
+        // Ignore deliveries older than what is already shown
+        return change && change.version > request.version
+          ? { ...request, ...change }
+          : request;
+      }),
+    );
+  }, []);
+
   const createRequest = useCallback(
     async (payload: MaintenanceRequestCreate): Promise<MaintenanceRequest> => {
       const { data } = await api.post<MaintenanceRequest>(
         '/api/requests',
         payload,
       );
-      // Go to page 1 to see the new record (newest first)
-      setPage(1);
-      await fetchRequests();
+      // Go to page 1 to see the new record (newest first); changing the
+      // page refetches, otherwise the record is inserted in place
+      if (page === 1) {
+        applyCreated(data);
+      } else {
+        setPage(1);
+      }
       return data;
     },
-    [fetchRequests],
+    [page, applyCreated],
   );
 
   return {
@@ -79,6 +117,8 @@ export function useRequests(): UseRequestsReturn {
     total,
     setPage,
     refresh: fetchRequests,
+    applyCreated,
+    applyUpdated,
     createRequest,
   };
 }
@@ -10,6 +10,8 @@ export interface MaintenanceRequest {
   priority: Priority;
   status: Status;
   created_at: string;
+  completed_at: string | null;
+  version: number;
 }
 
 export interface MaintenanceRequestCreate {
@@ -31,3 +33,25 @@ export interface AnalyticsStats {
   most_common_category: string | null;
   high_priority_count: number;
 }
+
+export interface StatsDelta {
+  total_requests: number;
+  high_priority_count: number;
+  categories: Record<string, number>;
+}
+
+export interface RequestCreatedEvent {
+  request: MaintenanceRequest;
+  stats: StatsDelta;
+}
+
+export type RequestChange = Pick<
+  MaintenanceRequest,
+  'id' | 'status' | 'priority' | 'version'
+>;
+
+export interface RequestsUpdatedEvent {
+  // null when the batch was too large to list; refetch instead
+  requests: RequestChange[] | null;
+  stats: StatsDelta;
+}